@@ -13,9 +13,11 @@ Date: October 7, 2025
 """
 
 import ast
+import contextlib
 import sys
 import os
 import importlib.util
+import importlib.machinery
 import inspect
 import difflib
 import argparse
@@ -23,62 +25,375 @@ import types
 import tempfile
 import subprocess
 import traceback
-from typing import Dict, List, Set, Tuple, Any, Optional, Callable
-from dataclasses import dataclass
+import math
+import copy
+import itertools
+import functools
+import getpass
+import hashlib
+import pickle
+import threading
+import time
+import signal
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, DefaultDict, Iterator, List, Set, FrozenSet, Tuple, Any, Optional, Callable, Sequence, Union
+from dataclasses import dataclass, field, replace
 import warnings
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings("ignore")
+# Read size for source file data beyond the size reported by os.stat
+READ_BUFFER_SIZE = 128 * 1024
 
-@dataclass
+# Part of the analysis cache key: bump whenever the cached analysis layout or contents change
+TOOL_VERSION = "1.8"
+
+def _read_source(filepath: str, size: int) -> bytes:
+    """Read a whole file with raw os.read calls, bypassing the buffered I/O layer"""
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        content = os.read(fd, size)
+        # Regular files come back in one read; keep going on short reads or if the file grew
+        while True:
+            chunk = os.read(fd, READ_BUFFER_SIZE)
+            if not chunk:
+                return content
+            content += chunk
+    finally:
+        os.close(fd)
+
+class _SourceExpr:
+    """AST expression compared structurally and rendered as source only when displayed"""
+    __slots__ = ('node', 'key', '_text')
+    
+    def __init__(self, node: ast.AST):
+        self.node = node
+        # ast.dump skips the unparser's string building; only equality is needed here
+        self.key = ast.dump(node, annotate_fields=False)
+        self._text: Optional[str] = None
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SourceExpr):
+            return self.key == other.key
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+    
+    def __str__(self) -> str:
+        # Unparsed on first display only; reports may render the same expression repeatedly
+        if self._text is None:
+            self._text = ast.unparse(self.node)
+        return self._text
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+# __slots__ for dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, eq=False, **_DATACLASS_SLOTS)
+class FunctionSig:
+    """Signature fields of a module-level function that take part in the comparison"""
+    args: Tuple[str, ...]
+    defaults: int
+    varargs: Optional[str]
+    kwonlyargs: Tuple[str, ...]
+    kwargs: Optional[str]
+    returns: Optional[_SourceExpr]
+    is_async: bool
+    # 16-byte fingerprint of all the fields, so unchanged signatures compare in one bytes comparison
+    key: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Plain values only (the return annotation by its dump), so the repr is stable
+        fields = (self.args, self.defaults, self.varargs, self.kwonlyargs, self.kwargs,
+                  self.returns.key if self.returns is not None else None, self.is_async)
+        object.__setattr__(self, 'key', hashlib.blake2b(repr(fields).encode('utf-8', 'surrogatepass'),
+                                                        digest_size=16).digest())
+    
+    # Equality through the fingerprint instead of a field-by-field tuple comparison
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FunctionSig):
+            return self.key == other.key
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class MethodInfo:
+    """Method of a module-level class"""
+    name: str
+    args: Tuple[str, ...]
+    is_async: bool
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ClassInfo:
+    """Module-level class: bases, decorators and methods by name"""
+    name: str
+    line: int
+    bases: Tuple[_SourceExpr, ...]
+    # Compared but left out of the hash: a dict is not hashable
+    methods: Dict[str, MethodInfo] = field(hash=False)
+    decorators: Tuple[_SourceExpr, ...]
+
+@dataclass(**_DATACLASS_SLOTS)
 class ModuleAnalysis:
     """Structure to store module analysis results"""
     filepath: str
-    functions: Dict[str, Dict[str, Any]]
-    classes: Dict[str, Dict[str, Any]]
+    functions: Dict[str, FunctionSig]
+    classes: Dict[str, ClassInfo]
     variables: Dict[str, Any]
     imports: Dict[str, Set[str]]
-    decorators: Set[str]
+    decorators: Set[_SourceExpr]
     syntax_valid: bool
     importable: bool
     file_size: int
     line_count: int
+    # Name sets derived from the dicts above, built once for the comparisons
+    function_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    class_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    variable_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.function_names = frozenset(self.functions)
+        self.class_names = frozenset(self.classes)
+        self.variable_names = frozenset(self.variables)
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(filepath: str, mtime_ns: int, size: int) -> Tuple[ast.Module, int]:
+    """Parse a file once per (path, mtime, size); returns the tree and the line count"""
+    # Raw bytes: ast.parse decodes them itself (honouring coding cookies)
+    content = _read_source(filepath, size)
+    tree = ast.parse(content)
+    # A trailing newline terminates the last line rather than starting a new one
+    line_count = content.count(b'\n') + (1 if content and not content.endswith(b'\n') else 0)
+    return tree, line_count
+
+@functools.lru_cache(maxsize=64)
+def _compile_cached(filepath: str, mtime_ns: int, size: int) -> types.CodeType:
+    """Compile a file once per (path, mtime, size), from the tree shared with the analysis"""
+    tree, _ = _parse_cached(filepath, mtime_ns, size)
+    return compile(tree, filepath, 'exec', dont_inherit=True)
+
+def _analysis_cache_path(filepath: str, st: os.stat_result) -> str:
+    """Sidecar pickle location for the analysis of a given file version"""
+    # The interpreter is part of the key: the ast.dump-based signature keys differ between versions
+    key = (f"{os.path.abspath(filepath)}\0{st.st_mtime_ns}\0{st.st_size}\0{TOOL_VERSION}"
+           f"\0{sys.implementation.cache_tag}")
+    digest = hashlib.sha1(key.encode('utf-8', 'surrogatepass')).hexdigest()
+    # Per-user directory: pickles are only ever loaded from a location nobody else can write to
+    user = str(os.getuid()) if hasattr(os, 'getuid') else getpass.getuser()
+    cache_dir = os.path.join(tempfile.gettempdir(), f"module_interchangeability_validator-{user}")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if hasattr(os, 'getuid'):
+        st_dir = os.stat(cache_dir)
+        if st_dir.st_uid != os.getuid() or st_dir.st_mode & 0o077:
+            raise PermissionError(f"refusing to use {cache_dir}: not private to the current user")
+    return os.path.join(cache_dir, f"{digest}.pickle")
+
+def _load_cached_analysis(cache_path: str) -> Optional[ModuleAnalysis]:
+    """Load a pickled analysis, or None if it is missing or unreadable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            analysis = pickle.load(f)
+    except Exception:
+        return None
+    return analysis if isinstance(analysis, ModuleAnalysis) else None
+
+def _store_cached_analysis(cache_path: str, analysis: ModuleAnalysis):
+    """Pickle an analysis atomically so concurrent runs never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(analysis, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Statement containers that may hold module-level definitions (if/try/with/match blocks)
+_BLOCK_NODES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+def _is_main_guard(test: ast.expr) -> bool:
+    """Whether an if test is `__name__ == "__main__"` (either way round)"""
+    if not (isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)):
+        return False
+    for name, value in ((test.left, test.comparators[0]), (test.comparators[0], test.left)):
+        if (isinstance(name, ast.Name) and name.id == '__name__'
+                and isinstance(value, ast.Constant) and value.value == '__main__'):
+            return True
+    return False
+
+class _ModuleCollector(ast.NodeVisitor):
+    """Collect module-level functions, classes, imports and variables in one pass"""
+    
+    def __init__(self) -> None:
+        self.functions: Dict[str, FunctionSig] = {}
+        self.classes: Dict[str, ClassInfo] = {}
+        self.variables: Dict[str, Any] = {}
+        self.imports: Dict[str, Set[str]] = {'from_imports': set(), 'direct_imports': set()}
+        self.decorators: Set[_SourceExpr] = set()
+    
+    # Handler per node type, resolved once instead of NodeVisitor's per-node name lookup
+    _dispatch: Dict[type, Callable[..., Any]] = {}
+    
+    def visit(self, node: ast.AST) -> Any:
+        node_type = type(node)
+        handler = self._dispatch.get(node_type)
+        if handler is None:
+            handler = self._dispatch[node_type] = getattr(
+                _ModuleCollector, 'visit_' + node_type.__name__, _ModuleCollector.generic_visit)
+        return handler(self, node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        # Descend into nested statement blocks only, never into expressions
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _BLOCK_NODES):
+                self.visit(child)
+    
+    def visit_If(self, node: ast.If) -> None:
+        # The body of `if __name__ == "__main__":` never runs on import, so its names are
+        # not module attributes; an else branch does run
+        if _is_main_guard(node.test):
+            for child in node.orelse:
+                self.visit(child)
+        else:
+            self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        # Function bodies are not visited: nested definitions are not module attributes.
+        # Argument names are interned so equal signatures mostly compare by identity.
+        self.functions[node.name] = FunctionSig(
+            args=tuple(sys.intern(arg.arg) for arg in node.args.args),
+            defaults=len(node.args.defaults),
+            varargs=node.args.vararg.arg if node.args.vararg else None,
+            kwonlyargs=tuple(sys.intern(arg.arg) for arg in node.args.kwonlyargs),
+            kwargs=node.args.kwarg.arg if node.args.kwarg else None,
+            returns=_SourceExpr(node.returns) if node.returns else None,
+            is_async=isinstance(node, ast.AsyncFunctionDef)
+        )
+        
+        # Collect decorators
+        self.decorators.update(_SourceExpr(d) for d in node.decorator_list)
+    
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.visit_FunctionDef(node)
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        # Analyze class methods
+        methods: Dict[str, MethodInfo] = {}
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods[item.name] = MethodInfo(
+                    name=item.name,
+                    args=tuple(sys.intern(arg.arg) for arg in item.args.args),
+                    is_async=isinstance(item, ast.AsyncFunctionDef)
+                )
+        
+        self.classes[node.name] = ClassInfo(
+            name=node.name,
+            line=node.lineno,
+            bases=tuple(_SourceExpr(base) for base in node.bases),
+            methods=methods,
+            decorators=tuple(_SourceExpr(d) for d in node.decorator_list)
+        )
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports['direct_imports'].add(alias.name)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ''
+        for alias in node.names:
+            self.imports['from_imports'].add(f"{module}.{alias.name}")
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        # Global variables (module-level assignments)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                try:
+                    value = ast.unparse(node.value)
+                    self.variables[target.id] = {
+                        'value': value,
+                        'line': node.lineno,
+                        'type': type(node.value).__name__
+                    }
+                except:
+                    self.variables[target.id] = {
+                        'value': '<complex_expression>',
+                        'line': node.lineno,
+                        'type': 'complex'
+                    }
     
 class ModuleInterchangeabilityValidator:
     """Python module interchangeability validator"""
     
-    def __init__(self, original_file: str, test_file: str, verbose: bool = False, run_differential: bool = False):
+    # Log prefixes per level, and the levels shown even without --verbose
+    _PREFIXES = {
+        "INFO": "ℹ️",
+        "SUCCESS": "✅",
+        "ERROR": "❌",
+        "WARNING": "⚠️",
+        "DEBUG": "🔍"
+    }
+    _ALWAYS_SHOWN = frozenset(("ERROR", "SUCCESS", "WARNING"))
+    
+    def __init__(self, original_file: str, test_file: str, verbose: bool = False, run_differential: bool = False,
+                 check_import: bool = False, use_cache: bool = True):
         self.original_file = original_file
         self.test_file = test_file
         self.verbose = verbose
         self.run_differential = run_differential
-        self.original_analysis = None
-        self.test_analysis = None
+        self.check_import = check_import
+        self.use_cache = use_cache
+        self.original_analysis: Optional[ModuleAnalysis] = None
+        self.test_analysis: Optional[ModuleAnalysis] = None
+        # Memoized comparison results, reset whenever the analyses are rebuilt
+        self._sig_cache: Optional[Dict[str, Any]] = None
+        self._class_cache: Optional[Dict[str, Any]] = None
+        self._var_cache: Optional[Dict[str, Any]] = None
+        self._import_cache: Optional[Dict[str, Any]] = None
+        self._score_cache: Optional[float] = None
         self.differential_tester = DifferentialTester(self) if run_differential else None
         
     def log(self, message: str, level: str = "INFO"):
         """Logger with verbosity level"""
-        if self.verbose or level in ["ERROR", "SUCCESS", "WARNING"]:
-            prefix = {
-                "INFO": "ℹ️",
-                "SUCCESS": "✅",
-                "ERROR": "❌",
-                "WARNING": "⚠️",
-                "DEBUG": "🔍"
-            }.get(level, "ℹ️")
-            print(f"{prefix} {message}")
+        if not self.verbose and level not in self._ALWAYS_SHOWN:
+            return
+        # One write per message: the line is never split by output from another thread
+        sys.stdout.write(f"{self._PREFIXES.get(level, 'ℹ️')} {message}\n")
     
     def analyze_file_structure(self, filepath: str) -> Optional[ModuleAnalysis]:
         """Analyze the complete structure of a Python file"""
         self.log(f"Structural analysis of {filepath}...", "DEBUG")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # One stat call provides the file statistics and the cache key
+            st = os.stat(filepath)
+            
+            # Analyses of unchanged files are reused across runs. Executing the module
+            # (--check-import) depends on more than the file itself, so it is never cached.
+            cache_path = None
+            if self.use_cache and not self.check_import:
+                try:
+                    cache_path = _analysis_cache_path(filepath, st)
+                except OSError as e:
+                    self.log(f"Analysis cache unavailable: {e}", "DEBUG")
+                if cache_path is not None:
+                    cached = _load_cached_analysis(cache_path)
+                    if cached is not None:
+                        self.log(f"Using cached analysis for {filepath}", "DEBUG")
+                        self.log(f"Python syntax valid for {filepath}", "SUCCESS")
+                        # The key is the absolute path; keep the caller's spelling of it
+                        return replace(cached, filepath=filepath)
             
-            # Syntax validation
+            # Syntax validation (the parsed tree is reused for the analysis)
             try:
-                ast.parse(content)
+                tree, line_count = _parse_cached(filepath, st.st_mtime_ns, st.st_size)
                 syntax_valid = True
                 self.log(f"Python syntax valid for {filepath}", "SUCCESS")
             except SyntaxError as e:
@@ -86,105 +401,31 @@ class ModuleInterchangeabilityValidator:
                 self.log(f"Syntax error in {filepath}: {e}", "ERROR")
                 return None
             
-            # AST analysis
-            tree = ast.parse(content)
-            
-            functions = {}
-            classes = {}
-            variables = {}
-            imports = {'from_imports': set(), 'direct_imports': set()}
-            decorators = set()
-            
-            for node in ast.walk(tree):
-                # Functions
-                if isinstance(node, ast.FunctionDef):
-                    func_info = {
-                        'name': node.name,
-                        'line': node.lineno,
-                        'args': [arg.arg for arg in node.args.args],
-                        'defaults': len(node.args.defaults),
-                        'varargs': node.args.vararg.arg if node.args.vararg else None,
-                        'kwonlyargs': [arg.arg for arg in node.args.kwonlyargs],
-                        'kwargs': node.args.kwarg.arg if node.args.kwarg else None,
-                        'returns': ast.unparse(node.returns) if node.returns else None,
-                        'docstring': ast.get_docstring(node),
-                        'decorators': [ast.unparse(d) for d in node.decorator_list],
-                        'is_async': isinstance(node, ast.AsyncFunctionDef)
-                    }
-                    functions[node.name] = func_info
-                    
-                    # Collect decorators
-                    for decorator in node.decorator_list:
-                        decorators.add(ast.unparse(decorator))
-                
-                # Classes
-                elif isinstance(node, ast.ClassDef):
-                    class_info = {
-                        'name': node.name,
-                        'line': node.lineno,
-                        'bases': [ast.unparse(base) for base in node.bases],
-                        'methods': {},
-                        'docstring': ast.get_docstring(node),
-                        'decorators': [ast.unparse(d) for d in node.decorator_list]
-                    }
-                    
-                    # Analyze class methods
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            method_info = {
-                                'name': item.name,
-                                'args': [arg.arg for arg in item.args.args],
-                                'is_async': isinstance(item, ast.AsyncFunctionDef),
-                                'docstring': ast.get_docstring(item)
-                            }
-                            class_info['methods'][item.name] = method_info
-                    
-                    classes[node.name] = class_info
-                
-                # Imports
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports['direct_imports'].add(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ''
-                    for alias in node.names:
-                        imports['from_imports'].add(f"{module}.{alias.name}")
-                
-                # Global variables (module-level assignments)
-                elif isinstance(node, ast.Assign):
-                    # Check if we are at the module level by walking the parents
-                    is_module_level = True
-                    for parent in ast.walk(tree):
-                        if hasattr(parent, 'body') and node not in parent.body:
-                            if not isinstance(parent, ast.Module):
-                                is_module_level = False
-                                break
-                    
-                    if is_module_level:
-                        for target in node.targets:
-                            if isinstance(target, ast.Name):
-                                try:
-                                    value = ast.unparse(node.value)
-                                    variables[target.id] = {
-                                        'value': value,
-                                        'line': node.lineno,
-                                        'type': type(node.value).__name__
-                                    }
-                                except:
-                                    variables[target.id] = {
-                                        'value': '<complex_expression>',
-                                        'line': node.lineno,
-                                        'type': 'complex'
-                                    }
+            # AST analysis (module-level definitions only)
+            collector = _ModuleCollector()
+            collector.visit(tree)
+            functions = collector.functions
+            classes = collector.classes
+            variables = collector.variables
+            imports = collector.imports
+            decorators = collector.decorators
             
             # File statistics
-            file_size = os.path.getsize(filepath)
-            line_count = len(content.split('\n'))
+            file_size = st.st_size
             
-            # Importability test
-            importable = self.test_importability(filepath)
+            # Importability test: executing the module is opt-in, compiling it is cheap and side-effect free
+            if self.check_import:
+                importable = self.test_importability(filepath, tree)
+            else:
+                try:
+                    # Cached: differential testing executes this same code object
+                    _compile_cached(filepath, st.st_mtime_ns, st.st_size)
+                    importable = True
+                except (SyntaxError, ValueError) as e:
+                    self.log(f"Compilation error for {filepath}: {e}", "DEBUG")
+                    importable = False
             
-            return ModuleAnalysis(
+            analysis = ModuleAnalysis(
                 filepath=filepath,
                 functions=functions,
                 classes=classes,
@@ -197,84 +438,126 @@ class ModuleInterchangeabilityValidator:
                 line_count=line_count
             )
             
+            if cache_path is not None:
+                try:
+                    _store_cached_analysis(cache_path, analysis)
+                except Exception as e:
+                    self.log(f"Could not cache analysis of {filepath}: {e}", "DEBUG")
+            
+            return analysis
+            
         except Exception as e:
             self.log(f"Error analyzing {filepath}: {e}", "ERROR")
             return None
     
-    def test_importability(self, filepath: str) -> bool:
-        """Test if a file can be imported as a module"""
+    def test_importability(self, filepath: str, tree: Optional[ast.Module] = None) -> bool:
+        """Test if a file can be imported as a module (reusing its parsed tree if given)"""
         try:
             # Create a temporary module name
             module_name = os.path.basename(filepath).replace('.py', '_temp')
+            
+            if tree is not None:
+                # Compile the tree already parsed by the analysis instead of reading the file again
+                code = compile(tree, filepath, 'exec')
+                module = types.ModuleType(module_name)
+                module.__file__ = filepath
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    exec(code, module.__dict__)
+                return True
+            
             spec = importlib.util.spec_from_file_location(module_name, filepath)
             
             if spec and spec.loader:
                 module = importlib.util.module_from_spec(spec)
-                # Try to load the module without fully executing it
-                spec.loader.exec_module(module)
+                # Silence warnings raised by the module's own top-level code
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    spec.loader.exec_module(module)
                 return True
             return False
         except Exception as e:
             self.log(f"Import error for {filepath}: {e}", "DEBUG")
             return False
     
+    def _require_analyses(self) -> Tuple[ModuleAnalysis, ModuleAnalysis]:
+        """Return both analyses, which validate() must have produced"""
+        if self.original_analysis is None or self.test_analysis is None:
+            raise RuntimeError("Both files must be analyzed (run validate()) before comparing them")
+        return self.original_analysis, self.test_analysis
+    
+    def _reset_caches(self):
+        """Drop memoized comparison results after the analyses change"""
+        self._sig_cache = None
+        self._class_cache = None
+        self._var_cache = None
+        self._import_cache = None
+        self._score_cache = None
+    
     def analyze_signatures_compatibility(self) -> Dict[str, Any]:
         """Analyze the compatibility of function signatures"""
+        if self._sig_cache is not None:
+            return self._sig_cache
         self.log("Analyzing signature compatibility...", "INFO")
         
-        results = {
+        original_analysis, test_analysis = self._require_analyses()
+        orig_funcs = original_analysis.functions
+        test_funcs = test_analysis.functions
+        orig_names = original_analysis.function_names
+        test_names = test_analysis.function_names
+        
+        # Missing / extra functions via the precomputed name sets
+        results: Dict[str, Any] = {
             'compatible_functions': [],
             'incompatible_functions': [],
-            'missing_functions': [],
-            'extra_functions': [],
+            'missing_functions': sorted(orig_names - test_names),
+            'extra_functions': sorted(test_names - orig_names),
             'signature_differences': {}
         }
         
-        orig_funcs = self.original_analysis.functions
-        test_funcs = self.test_analysis.functions
-        
-        # Functions missing in the test
-        for func_name in orig_funcs:
-            if func_name not in test_funcs:
-                results['missing_functions'].append(func_name)
-        
-        # Extra functions in the test
-        for func_name in test_funcs:
-            if func_name not in orig_funcs:
-                results['extra_functions'].append(func_name)
+        # Whole-dict equality (in C, one fingerprint comparison per function): nothing to diff
+        if orig_funcs == test_funcs:
+            results['compatible_functions'] = list(orig_funcs)
+            self._sig_cache = results
+            return results
         
         # Compare signatures for common functions
-        common_functions = set(orig_funcs.keys()) & set(test_funcs.keys())
+        common_functions = orig_names & test_names
         
         for func_name in common_functions:
             orig_func = orig_funcs[func_name]
             test_func = test_funcs[func_name]
             
+            # Fast path: unchanged signatures have the same fingerprint
+            if orig_func.key == test_func.key:
+                results['compatible_functions'].append(func_name)
+                continue
+            
             signature_diff = []
             
             # Compare arguments
-            if orig_func['args'] != test_func['args']:
-                signature_diff.append(f"Arguments: {orig_func['args']} -> {test_func['args']}")
+            if orig_func.args != test_func.args:
+                signature_diff.append(f"Arguments: {list(orig_func.args)} -> {list(test_func.args)}")
             
             # Compare default arguments
-            if orig_func['defaults'] != test_func['defaults']:
-                signature_diff.append(f"Defaults: {orig_func['defaults']} -> {test_func['defaults']}")
+            if orig_func.defaults != test_func.defaults:
+                signature_diff.append(f"Defaults: {orig_func.defaults} -> {test_func.defaults}")
             
             # Compare *args
-            if orig_func['varargs'] != test_func['varargs']:
-                signature_diff.append(f"*args: {orig_func['varargs']} -> {test_func['varargs']}")
+            if orig_func.varargs != test_func.varargs:
+                signature_diff.append(f"*args: {orig_func.varargs} -> {test_func.varargs}")
             
             # Compare **kwargs
-            if orig_func['kwargs'] != test_func['kwargs']:
-                signature_diff.append(f"**kwargs: {orig_func['kwargs']} -> {test_func['kwargs']}")
+            if orig_func.kwargs != test_func.kwargs:
+                signature_diff.append(f"**kwargs: {orig_func.kwargs} -> {test_func.kwargs}")
             
             # Compare return type
-            if orig_func['returns'] != test_func['returns']:
-                signature_diff.append(f"Return: {orig_func['returns']} -> {test_func['returns']}")
+            if orig_func.returns != test_func.returns:
+                signature_diff.append(f"Return: {orig_func.returns} -> {test_func.returns}")
             
             # Compare async/sync
-            if orig_func['is_async'] != test_func['is_async']:
-                signature_diff.append(f"Async: {orig_func['is_async']} -> {test_func['is_async']}")
+            if orig_func.is_async != test_func.is_async:
+                signature_diff.append(f"Async: {orig_func.is_async} -> {test_func.is_async}")
             
             if signature_diff:
                 results['incompatible_functions'].append(func_name)
@@ -282,35 +565,38 @@ class ModuleInterchangeabilityValidator:
             else:
                 results['compatible_functions'].append(func_name)
         
+        self._sig_cache = results
         return results
     
     def analyze_classes_compatibility(self) -> Dict[str, Any]:
         """Analyze the compatibility of classes"""
+        if self._class_cache is not None:
+            return self._class_cache
         self.log("Analyzing class compatibility...", "INFO")
         
-        results = {
+        original_analysis, test_analysis = self._require_analyses()
+        orig_classes = original_analysis.classes
+        test_classes = test_analysis.classes
+        orig_names = original_analysis.class_names
+        test_names = test_analysis.class_names
+        
+        # Missing / extra classes via the precomputed name sets
+        results: Dict[str, Any] = {
             'compatible_classes': [],
             'incompatible_classes': [],
-            'missing_classes': [],
-            'extra_classes': [],
+            'missing_classes': sorted(orig_names - test_names),
+            'extra_classes': sorted(test_names - orig_names),
             'class_differences': {}
         }
         
-        orig_classes = self.original_analysis.classes
-        test_classes = self.test_analysis.classes
-        
-        # Missing classes
-        for class_name in orig_classes:
-            if class_name not in test_classes:
-                results['missing_classes'].append(class_name)
-        
-        # Extra classes
-        for class_name in test_classes:
-            if class_name not in orig_classes:
-                results['extra_classes'].append(class_name)
+        # Identical records (including lines and decorators) are compatible without a per-class diff
+        if orig_classes == test_classes:
+            results['compatible_classes'] = list(orig_classes)
+            self._class_cache = results
+            return results
         
         # Compare common classes
-        common_classes = set(orig_classes.keys()) & set(test_classes.keys())
+        common_classes = orig_names & test_names
         
         for class_name in common_classes:
             orig_class = orig_classes[class_name]
@@ -319,12 +605,12 @@ class ModuleInterchangeabilityValidator:
             class_diff = []
             
             # Compare base classes
-            if orig_class['bases'] != test_class['bases']:
-                class_diff.append(f"Bases: {orig_class['bases']} -> {test_class['bases']}")
+            if orig_class.bases != test_class.bases:
+                class_diff.append(f"Bases: {list(orig_class.bases)} -> {list(test_class.bases)}")
             
             # Compare methods
-            orig_methods = set(orig_class['methods'].keys())
-            test_methods = set(test_class['methods'].keys())
+            orig_methods = orig_class.methods.keys()
+            test_methods = test_class.methods.keys()
             
             missing_methods = orig_methods - test_methods
             extra_methods = test_methods - orig_methods
@@ -337,11 +623,11 @@ class ModuleInterchangeabilityValidator:
             # Compare signatures of common methods
             common_methods = orig_methods & test_methods
             for method_name in common_methods:
-                orig_method = orig_class['methods'][method_name]
-                test_method = test_class['methods'][method_name]
+                orig_method = orig_class.methods[method_name]
+                test_method = test_class.methods[method_name]
                 
-                if orig_method['args'] != test_method['args']:
-                    class_diff.append(f"Method {method_name}: {orig_method['args']} -> {test_method['args']}")
+                if orig_method.args != test_method.args:
+                    class_diff.append(f"Method {method_name}: {list(orig_method.args)} -> {list(test_method.args)}")
             
             if class_diff:
                 results['incompatible_classes'].append(class_name)
@@ -349,34 +635,37 @@ class ModuleInterchangeabilityValidator:
             else:
                 results['compatible_classes'].append(class_name)
         
+        self._class_cache = results
         return results
     
     def analyze_variables_compatibility(self) -> Dict[str, Any]:
         """Analyze the compatibility of global variables"""
+        if self._var_cache is not None:
+            return self._var_cache
         self.log("Analyzing global variables compatibility...", "INFO")
         
-        orig_vars = self.original_analysis.variables
-        test_vars = self.test_analysis.variables
+        original_analysis, test_analysis = self._require_analyses()
+        orig_vars = original_analysis.variables
+        test_vars = test_analysis.variables
+        orig_names = original_analysis.variable_names
+        test_names = test_analysis.variable_names
         
-        results = {
+        # Missing / extra variables via the precomputed name sets
+        results: Dict[str, Any] = {
             'compatible_variables': [],
-            'missing_variables': [],
-            'extra_variables': [],
+            'missing_variables': sorted(orig_names - test_names),
+            'extra_variables': sorted(test_names - orig_names),
             'different_variables': []
         }
         
-        # Missing variables
-        for var_name in orig_vars:
-            if var_name not in test_vars:
-                results['missing_variables'].append(var_name)
-        
-        # Extra variables
-        for var_name in test_vars:
-            if var_name not in orig_vars:
-                results['extra_variables'].append(var_name)
+        # Identical records mean identical values
+        if orig_vars == test_vars:
+            results['compatible_variables'] = list(orig_vars)
+            self._var_cache = results
+            return results
         
         # Variables with different values
-        common_vars = set(orig_vars.keys()) & set(test_vars.keys())
+        common_vars = orig_names & test_names
         for var_name in common_vars:
             if orig_vars[var_name]['value'] != test_vars[var_name]['value']:
                 results['different_variables'].append({
@@ -387,65 +676,114 @@ class ModuleInterchangeabilityValidator:
             else:
                 results['compatible_variables'].append(var_name)
         
+        self._var_cache = results
         return results
     
     def analyze_imports_compatibility(self) -> Dict[str, Any]:
         """Analyze the compatibility of imports"""
+        if self._import_cache is not None:
+            return self._import_cache
         self.log("Analyzing imports compatibility...", "INFO")
         
-        orig_imports = self.original_analysis.imports
-        test_imports = self.test_analysis.imports
-        
-        results = {
-            'missing_direct_imports': list(orig_imports['direct_imports'] - test_imports['direct_imports']),
-            'extra_direct_imports': list(test_imports['direct_imports'] - orig_imports['direct_imports']),
-            'missing_from_imports': list(orig_imports['from_imports'] - test_imports['from_imports']),
-            'extra_from_imports': list(test_imports['from_imports'] - orig_imports['from_imports']),
-            'compatible_imports': len(set(orig_imports['direct_imports']) & set(test_imports['direct_imports'])) + 
-                              len(set(orig_imports['from_imports']) & set(test_imports['from_imports']))
-        };
+        original_analysis, test_analysis = self._require_analyses()
+        orig_imports = original_analysis.imports
+        test_imports = test_analysis.imports
+        
+        # The import collections are already sets: no need to copy them again
+        orig_direct = orig_imports['direct_imports']
+        test_direct = test_imports['direct_imports']
+        orig_from = orig_imports['from_imports']
+        test_from = test_imports['from_imports']
+        
+        results: Dict[str, Any] = {
+            # Left as sets: only their sizes are needed unless the report lists them
+            'missing_direct_imports': orig_direct - test_direct,
+            'extra_direct_imports': test_direct - orig_direct,
+            'missing_from_imports': orig_from - test_from,
+            'extra_from_imports': test_from - orig_from,
+            'compatible_imports': len(orig_direct & test_direct) + len(orig_from & test_from)
+        }
         
+        self._import_cache = results
         return results
     
     def calculate_compatibility_score(self) -> float:
         """Calculate an overall compatibility score (0-100)"""
+        if self._score_cache is not None:
+            return self._score_cache
         self.log("Calculating overall compatibility score...", "INFO")
         
+        original_analysis, _ = self._require_analyses()
         total_elements = 0
         compatible_elements = 0
         
         # Functions
-        total_elements += len(self.original_analysis.functions)
+        total_elements += len(original_analysis.functions)
         sig_analysis = self.analyze_signatures_compatibility()
         compatible_elements += len(sig_analysis['compatible_functions'])
         
         # Classes
-        total_elements += len(self.original_analysis.classes)
+        total_elements += len(original_analysis.classes)
         class_analysis = self.analyze_classes_compatibility()
         compatible_elements += len(class_analysis['compatible_classes'])
         
         # Variables
-        total_elements += len(self.original_analysis.variables)
+        total_elements += len(original_analysis.variables)
         var_analysis = self.analyze_variables_compatibility()
         compatible_elements += len(var_analysis['compatible_variables'])
         
         if total_elements == 0:
-            return 100.0
-        
-        return (compatible_elements / total_elements) * 100
+            self._score_cache = 100.0
+        else:
+            self._score_cache = (compatible_elements / total_elements) * 100
+        return self._score_cache
     
     def _get_current_date(self) -> str:
         """Get the current date and time formatted"""
         from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    def _files_identical(self) -> bool:
+        """Check whether the original and test files have byte-identical contents"""
+        try:
+            orig_st = os.stat(self.original_file)
+            test_st = os.stat(self.test_file)
+            # Both paths naming the same file (hard link, symlink, different spelling)
+            if os.path.samestat(orig_st, test_st):
+                return True
+            if orig_st.st_size != test_st.st_size:
+                return False
+            return (_read_source(self.original_file, orig_st.st_size)
+                    == _read_source(self.test_file, test_st.st_size))
+        except OSError:
+            # Let the analysis report unreadable files
+            return False
+    
     def validate(self) -> bool:
         """Main validation method"""
         self.log("🚀 Starting interchangeability validation...", "INFO")
         
-        # Analyze both files
-        self.original_analysis = self.analyze_file_structure(self.original_file)
-        self.test_analysis = self.analyze_file_structure(self.test_file)
+        # Results of a previous validate() call must not leak into this one
+        if self.differential_tester:
+            self.differential_tester.test_results = []
+        
+        # Byte-identical files are trivially interchangeable: analyze one and reuse it for both
+        identical = self._files_identical()
+        
+        # Analyze both files, original first so the log lines come out in a fixed order.
+        # Warnings about the analyzed code (e.g. SyntaxWarning while parsing) are suppressed
+        # for the duration only, leaving the host's warning filters untouched.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if identical:
+                self.log("Files are byte-identical, analyzing only once", "SUCCESS")
+                self.original_analysis = self.analyze_file_structure(self.original_file)
+                self.test_analysis = (replace(self.original_analysis, filepath=self.test_file)
+                                      if self.original_analysis else None)
+            else:
+                self.original_analysis = self.analyze_file_structure(self.original_file)
+                self.test_analysis = self.analyze_file_structure(self.test_file)
+        self._reset_caches()
         
         if not self.original_analysis:
             self.log(f"Unable to analyze original file: {self.original_file}", "ERROR")
@@ -455,9 +793,11 @@ class ModuleInterchangeabilityValidator:
             self.log(f"Unable to analyze test file: {self.test_file}", "ERROR")
             return False
         
-        # Run differential tests if requested
-        if self.run_differential and self.differential_tester:
-            self.differential_tester.run_differential_tests()
+        # Run differential tests if requested (identical sources cannot behave differently)
+        if self.run_differential and self.differential_tester and not identical:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self.differential_tester.run_differential_tests()
         
         # Calculate final score
         score = self.calculate_compatibility_score()
@@ -482,160 +822,179 @@ class ModuleInterchangeabilityValidator:
                 "SUCCESS" if is_interchangeable else "ERROR")
         
         return is_interchangeable
+    
+    @classmethod
+    def validate_many(cls, pairs: List[Tuple[str, str]], max_workers: Optional[int] = None,
+                      **options: Any) -> List[Tuple[bool, float]]:
+        """Validate several (original, test) pairs in separate processes; returns (interchangeable, score) per pair"""
+        pairs = list(pairs)
+        if len(pairs) <= 1:
+            return [_validate_pair(pair, options) for pair in pairs]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_validate_pair, pairs, [options] * len(pairs)))
 
     def generate_detailed_report(self) -> str:
         """Generate a detailed compatibility report"""
-        report = []
-        report.append("=" * 80)
-        report.append("🔍 MODULE INTERCHANGEABILITY REPORT")
-        report.append("=" * 80)
-        report.append(f"Original file: {self.original_file}")
-        report.append(f"Test file: {self.test_file}")
-        report.append(f"Date: {self._get_current_date()}")
-        report.append("")
+        return "\n".join(self._iter_report())
+    
+    def _iter_report(self) -> Iterator[str]:
+        """Yield the lines of the detailed compatibility report one at a time"""
+        yield "=" * 80
+        yield "🔍 MODULE INTERCHANGEABILITY REPORT"
+        yield "=" * 80
+        yield f"Original file: {self.original_file}"
+        yield f"Test file: {self.test_file}"
+        yield f"Date: {self._get_current_date()}"
+        yield ""
         
         # Check if analyses are available
         if not self.original_analysis or not self.test_analysis:
-            report.append("❌ ERROR: Could not analyze one or both files")
+            yield "❌ ERROR: Could not analyze one or both files"
             if not self.original_analysis:
-                report.append(f"  - Failed to analyze original file: {self.original_file}")
+                yield f"  - Failed to analyze original file: {self.original_file}"
             if not self.test_analysis:
-                report.append(f"  - Failed to analyze test file: {self.test_file}")
-            report.append("=" * 80)
-            return "\n".join(report)
+                yield f"  - Failed to analyze test file: {self.test_file}"
+            yield "=" * 80
+            return
         
         # Basic statistics
-        report.append("📊 BASIC STATISTICS")
-        report.append("-" * 40)
-        report.append(f"Original - Size: {self.original_analysis.file_size:,} bytes, Lines: {self.original_analysis.line_count}")
-        report.append(f"Test - Size: {self.test_analysis.file_size:,} bytes, Lines: {self.test_analysis.line_count}")
+        yield "📊 BASIC STATISTICS"
+        yield "-" * 40
+        yield f"Original - Size: {self.original_analysis.file_size:,} bytes, Lines: {self.original_analysis.line_count}"
+        yield f"Test - Size: {self.test_analysis.file_size:,} bytes, Lines: {self.test_analysis.line_count}"
         
         if self.original_analysis.file_size > 0:
             size_reduction = ((self.original_analysis.file_size - self.test_analysis.file_size) / self.original_analysis.file_size) * 100
-            report.append(f"Size reduction: {size_reduction:.1f}%")
+            yield f"Size reduction: {size_reduction:.1f}%"
         
-        report.append(f"Original - Syntax: {'✅' if self.original_analysis.syntax_valid else '❌'}, Importable: {'✅' if self.original_analysis.importable else '❌'}")
-        report.append(f"Test - Syntax: {'✅' if self.test_analysis.syntax_valid else '❌'}, Importable: {'✅' if self.test_analysis.importable else '❌'}")
-        report.append("")
+        yield f"Original - Syntax: {'✅' if self.original_analysis.syntax_valid else '❌'}, Importable: {'✅' if self.original_analysis.importable else '❌'}"
+        yield f"Test - Syntax: {'✅' if self.test_analysis.syntax_valid else '❌'}, Importable: {'✅' if self.test_analysis.importable else '❌'}"
+        yield ""
         
         # Compatibility score
         score = self.calculate_compatibility_score()
-        report.append("🎯 COMPATIBILITY SCORE")
-        report.append("-" * 40)
-        report.append(f"Global score: {score:.1f}/100")
+        yield "🎯 COMPATIBILITY SCORE"
+        yield "-" * 40
+        yield f"Global score: {score:.1f}/100"
         
         if score >= 95:
-            report.append("🟢 EXCELLENT - Modules are interchangeable")
+            yield "🟢 EXCELLENT - Modules are interchangeable"
         elif score >= 85:
-            report.append("🟡 GOOD - Modules are largely interchangeable with minor differences")
+            yield "🟡 GOOD - Modules are largely interchangeable with minor differences"
         elif score >= 70:
-            report.append("🟠 AVERAGE - Modules are partially interchangeable")
+            yield "🟠 AVERAGE - Modules are partially interchangeable"
         else:
-            report.append("🔴 LOW - Modules are not interchangeable")
-        report.append("")
+            yield "🔴 LOW - Modules are not interchangeable"
+        yield ""
         
         # Functions analysis
         sig_analysis = self.analyze_signatures_compatibility()
-        report.append("🔧 FUNCTIONS ANALYSIS")
-        report.append("-" * 40)
-        report.append(f"Original: {len(self.original_analysis.functions)} functions")
-        report.append(f"Test: {len(self.test_analysis.functions)} functions")
-        report.append(f"✅ Compatible: {len(sig_analysis['compatible_functions'])}")
-        report.append(f"❌ Incompatible: {len(sig_analysis['incompatible_functions'])}")
-        report.append(f"⚠️ Missing: {len(sig_analysis['missing_functions'])}")
-        report.append(f"➕ Extra: {len(sig_analysis['extra_functions'])}")
+        yield "🔧 FUNCTIONS ANALYSIS"
+        yield "-" * 40
+        yield f"Original: {len(self.original_analysis.functions)} functions"
+        yield f"Test: {len(self.test_analysis.functions)} functions"
+        yield f"✅ Compatible: {len(sig_analysis['compatible_functions'])}"
+        yield f"❌ Incompatible: {len(sig_analysis['incompatible_functions'])}"
+        yield f"⚠️ Missing: {len(sig_analysis['missing_functions'])}"
+        yield f"➕ Extra: {len(sig_analysis['extra_functions'])}"
         
         if sig_analysis['missing_functions']:
-            report.append("\nMissing functions:")
+            yield "\nMissing functions:"
             for func in sig_analysis['missing_functions']:
-                report.append(f"  - {func}")
+                yield f"  - {func}"
         
         if sig_analysis['extra_functions']:
-            report.append("\nExtra functions:")
+            yield "\nExtra functions:"
             for func in sig_analysis['extra_functions']:
-                report.append(f"  + {func}")
+                yield f"  + {func}"
         
         if sig_analysis['incompatible_functions']:
-            report.append("\nIncompatible functions:")
+            yield "\nIncompatible functions:"
             for func in sig_analysis['incompatible_functions']:
-                report.append(f"  ❌ {func}:")
+                yield f"  ❌ {func}:"
                 for diff in sig_analysis['signature_differences'][func]:
-                    report.append(f"    - {diff}")
+                    yield f"    - {diff}"
         
-        report.append("")
+        yield ""
         
         # Classes analysis
         class_analysis = self.analyze_classes_compatibility()
-        report.append("🏗️ CLASSES ANALYSIS")
-        report.append("-" * 40)
-        report.append(f"Original: {len(self.original_analysis.classes)} classes")
-        report.append(f"Test: {len(self.test_analysis.classes)} classes")
-        report.append(f"✅ Compatible: {len(class_analysis['compatible_classes'])}")
-        report.append(f"❌ Incompatible: {len(class_analysis['incompatible_classes'])}")
-        report.append(f"⚠️ Missing: {len(class_analysis['missing_classes'])}")
-        report.append(f"➕ Extra: {len(class_analysis['extra_classes'])}")
+        yield "🏗️ CLASSES ANALYSIS"
+        yield "-" * 40
+        yield f"Original: {len(self.original_analysis.classes)} classes"
+        yield f"Test: {len(self.test_analysis.classes)} classes"
+        yield f"✅ Compatible: {len(class_analysis['compatible_classes'])}"
+        yield f"❌ Incompatible: {len(class_analysis['incompatible_classes'])}"
+        yield f"⚠️ Missing: {len(class_analysis['missing_classes'])}"
+        yield f"➕ Extra: {len(class_analysis['extra_classes'])}"
         
         if class_analysis['missing_classes']:
-            report.append("\nMissing classes:")
+            yield "\nMissing classes:"
             for cls in class_analysis['missing_classes']:
-                report.append(f"  - {cls}")
+                yield f"  - {cls}"
         
         if class_analysis['extra_classes']:
-            report.append("\nExtra classes:")
+            yield "\nExtra classes:"
             for cls in class_analysis['extra_classes']:
-                report.append(f"  + {cls}")
+                yield f"  + {cls}"
         
-        report.append("")
+        yield ""
         
         # Variables analysis
         var_analysis = self.analyze_variables_compatibility()
-        report.append("📝 GLOBAL VARIABLES ANALYSIS")
-        report.append("-" * 40)
-        report.append(f"Original: {len(self.original_analysis.variables)} variables")
-        report.append(f"Test: {len(self.test_analysis.variables)} variables")
-        report.append(f"✅ Compatible: {len(var_analysis['compatible_variables'])}")
-        report.append(f"⚠️ Missing: {len(var_analysis['missing_variables'])}")
-        report.append(f"➕ Extra: {len(var_analysis['extra_variables'])}")
-        report.append(f"🔄 Different: {len(var_analysis['different_variables'])}")
+        yield "📝 GLOBAL VARIABLES ANALYSIS"
+        yield "-" * 40
+        yield f"Original: {len(self.original_analysis.variables)} variables"
+        yield f"Test: {len(self.test_analysis.variables)} variables"
+        yield f"✅ Compatible: {len(var_analysis['compatible_variables'])}"
+        yield f"⚠️ Missing: {len(var_analysis['missing_variables'])}"
+        yield f"➕ Extra: {len(var_analysis['extra_variables'])}"
+        yield f"🔄 Different: {len(var_analysis['different_variables'])}"
         
         if var_analysis['different_variables']:
-            report.append("\nVariables with different values:")
+            yield "\nVariables with different values:"
             for var in var_analysis['different_variables']:
-                report.append(f"  🔄 {var['name']}: {var['original']} -> {var['test']}")
+                yield f"  🔄 {var['name']}: {var['original']} -> {var['test']}"
         
-        report.append("")
+        yield ""
         
         # Imports analysis
         import_analysis = self.analyze_imports_compatibility()
-        report.append("📦 IMPORTS ANALYSIS")
-        report.append("-" * 40)
-        report.append(f"✅ Compatible imports: {import_analysis['compatible_imports']}")
-        report.append(f"⚠️ Missing direct imports: {len(import_analysis['missing_direct_imports'])}")
-        report.append(f"➕ Extra direct imports: {len(import_analysis['extra_direct_imports'])}")
-        report.append(f"⚠️ Missing from imports: {len(import_analysis['missing_from_imports'])}")
-        report.append(f"➕ Extra from imports: {len(import_analysis['extra_from_imports'])}")
+        yield "📦 IMPORTS ANALYSIS"
+        yield "-" * 40
+        yield f"✅ Compatible imports: {import_analysis['compatible_imports']}"
+        yield f"⚠️ Missing direct imports: {len(import_analysis['missing_direct_imports'])}"
+        yield f"➕ Extra direct imports: {len(import_analysis['extra_direct_imports'])}"
+        yield f"⚠️ Missing from imports: {len(import_analysis['missing_from_imports'])}"
+        yield f"➕ Extra from imports: {len(import_analysis['extra_from_imports'])}"
         
         if import_analysis['missing_direct_imports']:
-            report.append("\nMissing direct imports:")
-            for imp in import_analysis['missing_direct_imports']:
-                report.append(f"  - {imp}")
+            yield "\nMissing direct imports:"
+            for imp in sorted(import_analysis['missing_direct_imports']):
+                yield f"  - {imp}"
         
         if import_analysis['extra_direct_imports']:
-            report.append("\nExtra direct imports:")
-            for imp in import_analysis['extra_direct_imports']:
-                report.append(f"  + {imp}")
+            yield "\nExtra direct imports:"
+            for imp in sorted(import_analysis['extra_direct_imports']):
+                yield f"  + {imp}"
         
         # Differential testing results
         if self.run_differential and self.differential_tester and self.differential_tester.test_results:
-            diff_report = self.differential_tester.generate_differential_report()
-            report.append(diff_report)
-        
-        report.append("")
-        report.append("=" * 80)
+            yield from self.differential_tester._iter_differential_report()
         
-        return "\n".join(report)
+        yield ""
+        yield "=" * 80
+
+def _validate_pair(pair: Tuple[str, str], options: Dict[str, Any]) -> Tuple[bool, float]:
+    """Worker for validate_many: the validator itself stays in the worker process"""
+    validator = ModuleInterchangeabilityValidator(pair[0], pair[1], **options)
+    is_interchangeable = validator.validate()
+    # Same static score as --score-only; 0 when a file could not be analyzed
+    if validator.original_analysis is None or validator.test_analysis is None:
+        return is_interchangeable, 0.0
+    return is_interchangeable, validator.calculate_compatibility_score()
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DifferentialTestResult:
     """Structure to store differential test results"""
     test_name: str
@@ -647,274 +1006,456 @@ class DifferentialTestResult:
     execution_time_original: float = 0.0
     execution_time_test: float = 0.0
 
+# Built-in functions available to modules loaded for differential testing
+_SAFE_BUILTINS: Dict[str, Any] = {
+    '__import__': __import__,
+    'print': lambda *args, **kwargs: None,  # Suppress print
+    'len': len,
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+    'dict': dict,
+    'tuple': tuple,
+    'set': set,
+    'range': range,
+    'enumerate': enumerate,
+    'zip': zip,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'abs': abs,
+    'round': round,
+    'isinstance': isinstance,
+    'type': type,
+    'hasattr': hasattr,
+    'getattr': getattr,
+    'setattr': setattr,
+    'delattr': delattr,
+}
+
+# Common modules preloaded into that environment
+_SAFE_MODULES: Dict[str, types.ModuleType] = {
+    name: importlib.import_module(name)
+    for name in ('math', 'random', 'datetime', 're', 'json', 'os', 'sys', 'time',
+                 'threading', 'queue', 'io', 'signal', 'warnings')
+}
+
+# Argument values for functions with up to three positional parameters
+_BASIC_VALUES: Tuple[Tuple[Any, ...], ...] = (
+    (),                    # Empty list
+    (1, 2, 3),             # List of numbers
+    ("hello", "world"),    # List of strings
+    ({"key": "value"},),   # List of dicts
+)
+
+# (positional args, keyword args) of one differential test call
+_TestCase = Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+@functools.lru_cache(maxsize=16)
+def _test_cases_for_arity(arity: int) -> Tuple[_TestCase, ...]:
+    """Test inputs depend only on the number of positional parameters"""
+    if arity == 0:
+        # No arguments - single call with empty args
+        return (((), {}),)
+    if arity <= 3:
+        # Small number of arguments - generate combinations
+        return tuple((value_set[:arity], {}) for value_set in _BASIC_VALUES[:arity + 1])
+    # Many arguments - use minimal test
+    return (((None,) * arity, {}),)
+
+# Result, execution time and error message of one function call
+_Outcome = Tuple[Any, float, Optional[str]]
+
+# One differential test: function name, test case index, original and test functions, test case
+_Job = Tuple[str, int, Callable, Callable, _TestCase]
+
+# Seconds a tested function may run before it counts as failed with a timeout
+EXECUTION_TIMEOUT = 5
+
+def _timeout_handler(signum, frame):
+    """SIGALRM handler: abort the function under test"""
+    raise TimeoutError("Function execution timeout")
+
+def _call_in_thread(func: Callable, args: Sequence[Any], kwargs: Dict, timeout: float) -> Any:
+    """Run func in a daemon thread, raising TimeoutError if it has not returned in time.
+    
+    Fallback where SIGALRM is unavailable; a timed-out call is abandoned, not interrupted.
+    """
+    outcome: Dict[str, Any] = {}
+    
+    def target():
+        try:
+            outcome['result'] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome['error'] = e
+    
+    worker = threading.Thread(target=target, name="differential-test", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError("Function execution timeout")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('result')
+
+def _safe_eq(a: Any, b: Any) -> bool:
+    """== that treats a failing comparison (or a non-bool result) as unequal"""
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+# Comparators take the two values and the list of pairs still to compare: containers check
+# what they can themselves and queue their children there instead of recursing
+
+def _cmp_seq(a: Union[list, tuple], b: Union[list, tuple], pending: List[Tuple[Any, Any]]) -> bool:
+    """Lists and tuples: element by element once plain equality fails"""
+    if len(a) != len(b):
+        return False
+    if not _safe_eq(a, b):
+        pending.extend(zip(a, b))
+    return True
+
+def _cmp_dict(a: dict, b: dict, pending: List[Tuple[Any, Any]]) -> bool:
+    """Dicts: same keys, values compared pairwise"""
+    if a.keys() != b.keys():
+        return False
+    if not _safe_eq(a, b):
+        # Values in a's key order, paired in C: no generator frame per key
+        pending.extend(zip(a.values(), map(b.__getitem__, a)))
+    return True
+
+def _cmp_str(a: str, b: str, pending: List[Tuple[Any, Any]]) -> bool:
+    """Strings are equal up to surrounding whitespace"""
+    if a == b:
+        return True
+    # Stripping can only help if one of them starts or ends with whitespace
+    if (a and (a[0].isspace() or a[-1].isspace())) or (b and (b[0].isspace() or b[-1].isspace())):
+        return a.strip() == b.strip()
+    return False
+
+def _cmp_float(a: float, b: float, pending: List[Tuple[Any, Any]]) -> bool:
+    """Floats tolerate rounding differences"""
+    return math.isclose(a, b)
+
+def _cmp_exact(a: Any, b: Any, pending: List[Tuple[Any, Any]]) -> bool:
+    return a == b
+
+def _cmp_ndarray(a: Any, b: Any, np: types.ModuleType) -> bool:
+    """numpy arrays: vectorized comparison (a plain == gives an array, not a bool)"""
+    if a.shape != b.shape:
+        return False
+    try:
+        if a.dtype.kind in 'fc' or b.dtype.kind in 'fc':
+            # Same tolerance as math.isclose for Python floats
+            return bool(np.allclose(a, b, rtol=1e-09, atol=0.0))
+        return bool(np.array_equal(a, b))
+    except Exception:
+        return False
+
+_Comparator = Callable[[Any, Any, List[Tuple[Any, Any]]], bool]
+
+# Result comparison by type (subclasses use their nearest listed base); other types use a guarded ==
+_COMPARATORS: Dict[type, _Comparator] = {
+    list: _cmp_seq,
+    tuple: _cmp_seq,
+    dict: _cmp_dict,
+    str: _cmp_str,
+    float: _cmp_float,
+    int: _cmp_exact,
+    bool: _cmp_exact,
+    bytes: _cmp_exact,
+}
+
+# Types whose comparators queue children; revisiting one of their pairs means a cycle
+_CONTAINER_TYPES = frozenset((list, tuple, dict))
+
+# _comparator_for results by exact type, so each MRO is walked once
+_RESOLVED_COMPARATORS: Dict[type, Tuple[Optional[_Comparator], bool]] = {}
+
+def _comparator_for(result_type: type) -> Tuple[Optional[_Comparator], bool]:
+    """Comparator for a result type and whether it is a container, following the MRO"""
+    resolved = _RESOLVED_COMPARATORS.get(result_type)
+    if resolved is None:
+        resolved = (None, False)
+        for base in result_type.__mro__:
+            comparator = _COMPARATORS.get(base)
+            if comparator is not None:
+                # OrderedDict, Counter, namedtuples, str subclasses... compare like their base
+                resolved = (comparator, base in _CONTAINER_TYPES)
+                break
+        _RESOLVED_COMPARATORS[result_type] = resolved
+    return resolved
+
 class DifferentialTester:
     """Differential testing for module behavior validation"""
     
     def __init__(self, validator: 'ModuleInterchangeabilityValidator'):
         self.validator = validator
         self.test_results: List[DifferentialTestResult] = []
+        # Loaded modules (None when loading failed) by (filepath, mtime)
+        self._module_cache: Dict[Tuple[str, int], Optional[types.ModuleType]] = {}
+        # SIGALRM handler that _timeout_handler replaced, while it is installed
+        self._previous_alarm_handler: Any = None
+        self._alarm_installed = False
         
     def create_safe_test_environment(self) -> Dict[str, Any]:
         """Create a safe environment for testing functions"""
-        safe_env = {
-            # Built-in functions
-            '__builtins__': {
-                '__import__': __import__,
-                'print': lambda *args, **kwargs: None,  # Suppress print
-                'len': len,
-                'str': str,
-                'int': int,
-                'float': float,
-                'bool': bool,
-                'list': list,
-                'dict': dict,
-                'tuple': tuple,
-                'set': set,
-                'range': range,
-                'enumerate': enumerate,
-                'zip': zip,
-                'min': min,
-                'max': max,
-                'sum': sum,
-                'abs': abs,
-                'round': round,
-                'isinstance': isinstance,
-                'type': type,
-                'hasattr': hasattr,
-                'getattr': getattr,
-                'setattr': setattr,
-                'delattr': delattr,
-            },
-            # Common modules
-            'math': __import__('math'),
-            'random': __import__('random'),
-            'datetime': __import__('datetime'),
-            're': __import__('re'),
-            'json': __import__('json'),
-            'os': __import__('os'),
-            'sys': __import__('sys'),
-            'time': __import__('time'),
-            'threading': __import__('threading'),
-            'queue': __import__('queue'),
-            'io': __import__('io'),
-            'signal': __import__('signal'),
-            'warnings': __import__('warnings'),
-        }
-        return safe_env
+        # Fresh builtins per module so one module cannot alter the other's
+        return {'__builtins__': dict(_SAFE_BUILTINS), **_SAFE_MODULES}
     
     def load_module_safely(self, filepath: str) -> Optional[types.ModuleType]:
-        """Load a module in a safe environment"""
+        """Load a module in a safe environment (once per file version)"""
+        try:
+            st = os.stat(filepath)
+        except OSError as e:
+            self.validator.log(f"Error loading module {filepath}: {e}", "DEBUG")
+            return None
+        cache_key = (filepath, st.st_mtime_ns)
+        if cache_key not in self._module_cache:
+            self._module_cache[cache_key] = self._load_module(filepath, st)
+        return self._module_cache[cache_key]
+    
+    def _load_module(self, filepath: str, st: os.stat_result) -> Optional[types.ModuleType]:
+        """Execute a module's code in a safe environment"""
         try:
             module_name = os.path.basename(filepath).replace('.py', '_test')
             
-            # Read the source code directly
-            with open(filepath, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-            
-            # Create a safe environment
-            safe_env = self.create_safe_test_environment()
-            safe_env['__name__'] = module_name
-            safe_env['__file__'] = filepath
-            
-            # Execute the module in safe environment
-            exec(source_code, safe_env)
+            # The loader is only there so a spec can be built whatever the file's extension;
+            # the code itself is executed below
+            loader = importlib.machinery.SourceFileLoader(module_name, filepath)
+            spec = importlib.util.spec_from_file_location(module_name, filepath, loader=loader)
+            if spec is None:
+                self.validator.log(f"Error loading module {filepath}: no module spec", "DEBUG")
+                return None
+            module = importlib.util.module_from_spec(spec)
             
-            # Create a module object
-            module = types.ModuleType(module_name)
-            module.__file__ = filepath
+            # Code compiled from the tree the analysis already parsed: no second read or parse
+            code = _compile_cached(filepath, st.st_mtime_ns, st.st_size)
             
-            # Copy safe attributes to module
-            for name, obj in safe_env.items():
-                if not name.startswith('__') or name in ['__name__', '__file__']:
-                    setattr(module, name, obj)
+            # The module's code runs with the restricted builtins and the preloaded modules
+            vars(module).update(self.create_safe_test_environment())
+            exec(code, vars(module))
             
             return module
         except Exception as e:
             self.validator.log(f"Error loading module {filepath}: {e}", "DEBUG")
         return None
     
-    def create_test_inputs(self, func_signature: Dict[str, Any]) -> List[Tuple[List, Dict]]:
-        """Create test input combinations for a function"""
-        test_cases = []
-        
-        args = func_signature.get('args', [])
-        
-        # Generate test cases based on argument types
-        if len(args) == 0:
-            # No arguments - single call with empty args
-            test_cases.append(([], {}))
-        elif len(args) <= 3:
-            # Small number of arguments - generate combinations
-            basic_values = [
-                [],                    # Empty list
-                [1, 2, 3],            # List of numbers
-                ["hello", "world"],   # List of strings
-                [{"key": "value"}],    # List of dicts
-            ]
-            
-            for i, value_set in enumerate(basic_values[:len(args) + 1]):
-                test_args = value_set[:len(args)]
-                test_cases.append((test_args, {}))
-        else:
-            # Many arguments - use minimal test
-            test_cases.append(([None] * len(args), {}))
-        
-        return test_cases
+    def create_test_inputs(self, func_signature: FunctionSig) -> Tuple[_TestCase, ...]:
+        """Create test input combinations for a function (shared: copy the arguments before a call)"""
+        return _test_cases_for_arity(len(func_signature.args))
+    
+    def _install_timeout_handler(self) -> bool:
+        """Install the SIGALRM timeout handler for a batch of calls; False where it cannot be used"""
+        # SIGALRM only exists on Unix and can only be handled in the main thread
+        if self._alarm_installed or not hasattr(signal, 'SIGALRM') \
+                or threading.current_thread() is not threading.main_thread():
+            return False
+        self._previous_alarm_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+        self._alarm_installed = True
+        return True
     
-    def execute_function_safely(self, func: Callable, args: List, kwargs: Dict) -> Tuple[Any, float, Optional[str]]:
+    def _restore_timeout_handler(self):
+        """Put back the SIGALRM handler that was active before _install_timeout_handler"""
+        previous = self._previous_alarm_handler
+        # None means the handler was not set from Python; the default is the closest match
+        signal.signal(signal.SIGALRM, signal.SIG_DFL if previous is None else previous)
+        self._previous_alarm_handler = None
+        self._alarm_installed = False
+    
+    def execute_function_safely(self, func: Callable, args: Sequence[Any], kwargs: Dict) -> Tuple[Any, float, Optional[str]]:
         """Execute a function safely and return result, time, and error"""
-        import time
-        import signal
-        start_time = time.time()
+        # Called outside a test run: install the handler around this call only
+        if self._install_timeout_handler():
+            try:
+                return self.execute_function_safely(func, args, kwargs)
+            finally:
+                self._restore_timeout_handler()
+        
+        # The handler is installed once per run; worker threads fall back to _call_in_thread
+        use_alarm = self._alarm_installed and threading.current_thread() is threading.main_thread()
+        # Monotonic, integer nanoseconds; reported in seconds
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Set timeout for execution
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Function execution timeout")
+            if not use_alarm:
+                result = _call_in_thread(func, args, kwargs, EXECUTION_TIMEOUT)
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                return result, execution_time, None
             
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(5)  # 5 second timeout
+            # Set timeout for execution
+            signal.alarm(EXECUTION_TIMEOUT)
             
             result = func(*args, **kwargs)
             
             signal.alarm(0)  # Cancel timeout
             
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             return result, execution_time, None
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             error_msg = f"{type(e).__name__}: {str(e)}"
             return None, execution_time, error_msg
         finally:
-            try:
-                signal.alarm(0)  # Cancel timeout
-            except:
-                pass
+            if use_alarm:
+                try:
+                    signal.alarm(0)  # Cancel timeout
+                except:
+                    pass
     
     def compare_results(self, result1: Any, result2: Any) -> bool:
         """Compare two results for equality"""
-        try:
-            # Direct comparison
-            if result1 == result2:
-                return True
-            
-            # Type comparison
-            if type(result1) != type(result2):
-                return False
-            
-            # For collections, compare elements
-            if isinstance(result1, (list, tuple)):
-                if len(result1) != len(result2):
-                    return False
-                return all(self.compare_results(r1, r2) for r1, r2 in zip(result1, result2))
-            
-            elif isinstance(result1, dict):
-                if set(result1.keys()) != set(result2.keys()):
+        # Explicit stack instead of recursion: nested results cost no Python frames
+        pending: List[Tuple[Any, Any]] = [(result1, result2)]
+        seen: Set[Tuple[int, int]] = set()
+        while pending:
+            a, b = pending.pop()
+            if a is b:
+                continue
+            result_type = type(a)
+            if result_type is not type(b):
+                # Different types may still be equal (1 == 1.0)
+                if not _safe_eq(a, b):
                     return False
-                return all(self.compare_results(result1[k], result2[k]) for k in result1.keys())
-            
-            # String comparison with normalization
-            elif isinstance(result1, str):
-                return result1.strip() == result2.strip()
-            
-            return False
-            
-        except Exception:
-            return False
-    
-    def test_function_differentially(self, func_name: str) -> List[DifferentialTestResult]:
-        """Test a function differentially between original and test modules"""
-        results = []
-        
-        if not self.validator.original_analysis or not self.validator.test_analysis:
-            return results
-        
-        orig_funcs = self.validator.original_analysis.functions
-        test_funcs = self.validator.test_analysis.functions
-        
-        if func_name not in orig_funcs or func_name not in test_funcs:
-            return results
-        
-        # Load modules safely
-        orig_module = self.load_module_safely(self.validator.original_file)
-        test_module = self.load_module_safely(self.validator.test_file)
-        
-        if not orig_module or not test_module:
-            return results
-        
-        # Get functions
-        orig_func = getattr(orig_module, func_name, None)
-        test_func = getattr(test_module, func_name, None)
-        
-        if not orig_func or not test_func:
-            return results
-        
-        # Create test inputs
-        func_signature = orig_funcs[func_name]
-        test_cases = self.create_test_inputs(func_signature)
-        
-        for i, (args, kwargs) in enumerate(test_cases):
-            test_name = f"{func_name}_test_{i+1}"
-            
-            # Execute original function
-            orig_result, orig_time, orig_error = self.execute_function_safely(orig_func, args, kwargs)
-            
-            # Execute test function
-            test_result, test_time, test_error = self.execute_function_safely(test_func, args, kwargs)
-            
-            # Compare results
-            if orig_error or test_error:
-                # Both should have the same error type
-                passed = (orig_error is not None and test_error is not None and 
-                         type(orig_error.split(':')[0]) == type(test_error.split(':')[0]))
-                error_msg = f"Original: {orig_error}, Test: {test_error}" if not passed else None
+                continue
+            comparator, is_container = _comparator_for(result_type)
+            if comparator is None:
+                # numpy is never imported here, only looked up if the tested code loaded it
+                np = sys.modules.get('numpy')
+                if np is not None and isinstance(a, np.ndarray):
+                    equal = _cmp_ndarray(a, b, np)
+                else:
+                    equal = _safe_eq(a, b)
             else:
-                passed = self.compare_results(orig_result, test_result)
-                error_msg = None
-            
-            result = DifferentialTestResult(
-                test_name=test_name,
-                function_name=func_name,
-                original_result=orig_result,
-                test_result=test_result,
-                passed=passed,
-                error_msg=error_msg,
-                execution_time_original=orig_time,
-                execution_time_test=test_time
-            )
-            
-            results.append(result)
+                if is_container:
+                    # Self-referencing containers would otherwise queue the same pair forever
+                    pair_ids = (id(a), id(b))
+                    if pair_ids in seen:
+                        continue
+                    seen.add(pair_ids)
+                equal = comparator(a, b, pending)
+            if not equal:
+                return False
+        return True
+    
+    def _execute_case(self, call: Tuple[Callable, _TestCase]) -> _Outcome:
+        """Execute one function on one test case"""
+        func, (args, kwargs) = call
+        # Each call gets its own copy, so neither function sees the other's mutations
+        return self.execute_function_safely(func, copy.deepcopy(args), copy.deepcopy(kwargs))
+    
+    def _build_result(self, func_name: str, index: int, orig_outcome: _Outcome,
+                      test_outcome: _Outcome) -> DifferentialTestResult:
+        """Compare the outcomes of the original and test functions on one test case"""
+        orig_result, orig_time, orig_error = orig_outcome
+        test_result, test_time, test_error = test_outcome
+        
+        # Compare results
+        if orig_error or test_error:
+            # Both should have the same error type (the name before the first colon)
+            passed = (orig_error is not None and test_error is not None and
+                      orig_error.partition(':')[0] == test_error.partition(':')[0])
+            error_msg = f"Original: {orig_error}, Test: {test_error}" if not passed else None
+        else:
+            passed = self.compare_results(orig_result, test_result)
+            error_msg = None
+        
+        return DifferentialTestResult(
+            test_name=f"{func_name}_test_{index+1}",
+            function_name=func_name,
+            original_result=orig_result,
+            test_result=test_result,
+            passed=passed,
+            error_msg=error_msg,
+            execution_time_original=orig_time,
+            execution_time_test=test_time
+        )
+    
+    def test_function_differentially(self, func_name: str, func_signature: FunctionSig,
+                                     orig_func: Callable, test_func: Callable) -> List[DifferentialTestResult]:
+        """Test a function differentially between its original and test implementations"""
+        jobs = [(func_name, i, orig_func, test_func, test_case)
+                for i, test_case in enumerate(self.create_test_inputs(func_signature))]
+        return self._run_jobs(jobs, self.validator.verbose)
+    
+    def _run_jobs(self, jobs: List[_Job], debug: bool) -> List[DifferentialTestResult]:
+        """Execute the collected jobs and compare the outcomes of each (debug: log failures)"""
+        # Executions stay sequential: original and test share module state such as random
+        calls = [(func, test_case) for _, _, orig_func, test_func, test_case in jobs
+                 for func in (orig_func, test_func)]
+        installed = self._install_timeout_handler()
+        try:
+            outcomes = [self._execute_case(call) for call in calls]
+        finally:
+            if installed:
+                self._restore_timeout_handler()
         
+        results: List[DifferentialTestResult] = []
+        for job_index, (func_name, i, _, _, _) in enumerate(jobs):
+            try:
+                results.append(self._build_result(
+                    func_name, i, outcomes[2 * job_index], outcomes[2 * job_index + 1]))
+            except Exception as e:
+                if debug:
+                    self.validator.log(f"Error testing function {func_name}: {e}", "DEBUG")
         return results
     
     def run_differential_tests(self, max_functions_per_module: int = 10) -> List[DifferentialTestResult]:
         """Run differential tests on compatible functions"""
         self.validator.log("Running differential tests...", "INFO")
         
-        all_results = []
+        all_results: List[DifferentialTestResult] = []
         
         if not self.validator.original_analysis or not self.validator.test_analysis:
             self.validator.log("Cannot run differential tests: missing module analysis", "WARNING")
             return all_results
         
         orig_funcs = self.validator.original_analysis.functions
-        test_funcs = self.validator.test_analysis.functions
-        
-        # Find common functions
-        common_functions = set(orig_funcs.keys()) & set(test_funcs.keys())
+        test_names = self.validator.test_analysis.function_names
+        
+        # Common functions in source order, stopping at the limit. Calling an async function
+        # only creates a coroutine, which would compare unequal and never be awaited: skip them.
+        test_functions = list(itertools.islice(
+            (name for name, sig in orig_funcs.items() if name in test_names and not sig.is_async),
+            max_functions_per_module))
+        if not test_functions:
+            self.test_results = all_results
+            return all_results
         
-        # Limit the number of functions to test
-        test_functions = list(common_functions)[:max_functions_per_module]
+        # Each module is loaded once and shared by all the functions tested
+        orig_module = self.load_module_safely(self.validator.original_file)
+        test_module = self.load_module_safely(self.validator.test_file)
+        if not orig_module or not test_module:
+            self.validator.log("Cannot run differential tests: a module failed to load", "WARNING")
+            self.test_results = all_results
+            return all_results
         
+        # Stage 1: collect every (function, test case) job
+        orig_globals = vars(orig_module)
+        test_globals = vars(test_module)
+        # Read once; the DEBUG messages below are only formatted when they will be shown
+        debug = self.validator.verbose
+        jobs: List[_Job] = []
         for func_name in test_functions:
-            self.validator.log(f"Testing function: {func_name}", "DEBUG")
+            if debug:
+                self.validator.log(f"Testing function: {func_name}", "DEBUG")
             
-            try:
-                results = self.test_function_differentially(func_name)
-                all_results.extend(results)
-            except Exception as e:
-                self.validator.log(f"Error testing function {func_name}: {e}", "DEBUG")
+            # Get functions (the module may rebind or delete a name the analysis saw);
+            # module attributes live in the module dict, so skip the getattr machinery
+            orig_func = orig_globals.get(func_name)
+            test_func = test_globals.get(func_name)
+            if not orig_func or not test_func:
+                continue
+            
+            for i, test_case in enumerate(self.create_test_inputs(orig_funcs[func_name])):
+                jobs.append((func_name, i, orig_func, test_func, test_case))
+        
+        # Stages 2 and 3: execute them all, then compare the outcomes of each job
+        all_results = self._run_jobs(jobs, debug)
         
         self.test_results = all_results
         return all_results
@@ -923,48 +1464,51 @@ class DifferentialTester:
         """Generate a differential test report"""
         if not self.test_results:
             return "No differential tests performed."
-        
-        report = []
-        report.append("")
-        report.append("🧪 DIFFERENTIAL TESTING RESULTS")
-        report.append("-" * 40)
+        return "\n".join(self._iter_differential_report())
+    
+    def _iter_differential_report(self) -> Iterator[str]:
+        """Yield the lines of the differential test report one at a time"""
+        yield ""
+        yield "🧪 DIFFERENTIAL TESTING RESULTS"
+        yield "-" * 40
+        
+        # One pass groups the results by function and counts the passes, overall and per function
+        results_by_function: DefaultDict[str, List[DifferentialTestResult]] = defaultdict(list)
+        passed_by_function: DefaultDict[str, int] = defaultdict(int)
+        passed_tests = 0
+        for result in self.test_results:
+            results_by_function[result.function_name].append(result)
+            if result.passed:
+                passed_by_function[result.function_name] += 1
+                passed_tests += 1
         
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r.passed)
         failed_tests = total_tests - passed_tests
         
-        report.append(f"Total tests: {total_tests}")
-        report.append(f"✅ Passed: {passed_tests}")
-        report.append(f"❌ Failed: {failed_tests}")
-        report.append(f"Success rate: {(passed_tests/total_tests)*100:.1f}%")
-        report.append("")
-        
-        # Group results by function
-        results_by_function = {}
-        for result in self.test_results:
-            if result.function_name not in results_by_function:
-                results_by_function[result.function_name] = []
-            results_by_function[result.function_name].append(result)
+        yield f"Total tests: {total_tests}"
+        yield f"✅ Passed: {passed_tests}"
+        yield f"❌ Failed: {failed_tests}"
+        yield f"Success rate: {(passed_tests/total_tests)*100:.1f}%"
+        yield ""
         
         for func_name, results in results_by_function.items():
-            func_passed = sum(1 for r in results if r.passed)
+            func_passed = passed_by_function[func_name]
             func_total = len(results)
             
-            report.append(f"🔧 {func_name}: {func_passed}/{func_total} tests passed")
+            yield f"🔧 {func_name}: {func_passed}/{func_total} tests passed"
             
             # Show failed tests
-            failed_results = [r for r in results if not r.passed]
-            for result in failed_results:
-                report.append(f"  ❌ {result.test_name}")
+            for result in results:
+                if result.passed:
+                    continue
+                yield f"  ❌ {result.test_name}"
                 if result.error_msg:
-                    report.append(f"     Error: {result.error_msg}")
+                    yield f"     Error: {result.error_msg}"
                 else:
-                    report.append(f"     Original: {result.original_result}")
-                    report.append(f"     Test: {result.test_result}")
+                    yield f"     Original: {result.original_result}"
+                    yield f"     Test: {result.test_result}"
             
-            report.append("")
-        
-        return "\n".join(report)
+            yield ""
 
 def main():
     """Main function"""
@@ -989,15 +1533,23 @@ Usage examples:
                        help='Display only the compatibility score')
     parser.add_argument('--differential', '-d', action='store_true',
                        help='Run differential behavioral tests for more realistic validation')
+    parser.add_argument('--check-import', action='store_true',
+                       help='Test importability by executing the modules (runs their top-level code)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not reuse or store cached analyses of unchanged files')
     
     args = parser.parse_args()
     
-    # Check that files exist
-    if not os.path.exists(args.original):
+    # Check that files exist (and can be reached: NotADirectoryError, PermissionError...)
+    try:
+        os.stat(args.original)
+    except OSError:
         print(f"❌ Original file does not exist: {args.original}")
         sys.exit(1)
     
-    if not os.path.exists(args.test):
+    try:
+        os.stat(args.test)
+    except OSError:
         print(f"❌ Test file does not exist: {args.test}")
         sys.exit(1)
     
@@ -1006,7 +1558,9 @@ Usage examples:
         original_file=args.original,
         test_file=args.test,
         verbose=args.verbose,
-        run_differential=args.differential
+        run_differential=args.differential,
+        check_import=args.check_import,
+        use_cache=not args.no_cache
     )
     
     # Run the validation
@@ -1017,20 +1571,39 @@ Usage examples:
         score = validator.calculate_compatibility_score()
         print(f"{score:.1f}")
     else:
-        # Generate the report
-        report = validator.generate_detailed_report()
-        
-        # Display the report
-        print(report)
-        
-        # Save to a file if requested
-        if args.output:
+        save_error = None
+        with contextlib.ExitStack() as stack:
+            # Open the output file first so the report can be streamed to both destinations
+            output_file = None
+            if args.output:
+                try:
+                    output_file = stack.enter_context(open(args.output, 'w', encoding='utf-8'))
+                except Exception as e:
+                    save_error = e
+            
+            # Display (and save) the report line by line as it is generated
             try:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(report)
-                print(f"\n📄 Report saved to: {args.output}")
-            except Exception as e:
-                print(f"❌ Error saving report: {e}")
+                for line in validator._iter_report():
+                    print(line)
+                    if output_file:
+                        try:
+                            output_file.write(f"{line}\n")
+                        except Exception as e:
+                            save_error = e
+                            output_file = None
+            except BaseException:
+                # Do not leave half a report behind
+                if output_file:
+                    stack.close()
+                    with contextlib.suppress(OSError):
+                        os.remove(args.output)
+                raise
+        
+        # Reported after the report, whichever way saving ended
+        if save_error is not None:
+            print(f"❌ Error saving report: {save_error}")
+        elif args.output:
+            print(f"\n📄 Report saved to: {args.output}")
     
     # Exit code
     sys.exit(0 if is_interchangeable else 1)
@@ -0,0 +1,102 @@
+"""Regression tests for module_interchangeability_validator (run: python -m unittest discover -s tests)"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import module_interchangeability_validator as miv
+
+
+class ValidatorTestCase(unittest.TestCase):
+    """Temporary source files and a private analysis cache directory per test"""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmpdir = tmp.name
+        # The analysis cache lives under tempfile.gettempdir()
+        patcher = mock.patch.object(tempfile, 'tempdir', self.tmpdir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def write(self, name, source):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        return path
+    
+    def quietly(self, func, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func(*args)
+
+
+class AnalysisCacheTest(ValidatorTestCase):
+    
+    def test_entry_from_another_interpreter_is_ignored(self):
+        path = self.write('a.py', "def f(x):\n    return x\n")
+        other = self.write('b.py', "def g(x):\n    return x\n")
+        validator = miv.ModuleInterchangeabilityValidator(path, other)
+        
+        # Plant b.py's analysis where another interpreter would have cached a.py's
+        st = os.stat(path)
+        other_interpreter = types.SimpleNamespace(cache_tag='otherpython-99')
+        with mock.patch.object(sys, 'implementation', other_interpreter):
+            foreign_path = miv._analysis_cache_path(path, st)
+        miv._store_cached_analysis(foreign_path, self.quietly(validator.analyze_file_structure, other))
+        self.assertNotEqual(foreign_path, miv._analysis_cache_path(path, st))
+        
+        analysis = self.quietly(validator.analyze_file_structure, path)
+        self.assertEqual(analysis.function_names, frozenset({'f'}))
+
+
+
+class ModuleCollectorTest(ValidatorTestCase):
+    
+    def test_main_guard_body_is_not_module_level(self):
+        source = (
+            "def f(x):\n"
+            "    return x\n"
+            "\n"
+            "if {guard}:\n"
+            "    args = [1]\n"
+            "    def helper():\n"
+            "        pass\n"
+            "else:\n"
+            "    imported = True\n"
+            "\n"
+            "if DEBUG:\n"
+            "    debug_level = 2\n"
+        )
+        validator = miv.ModuleInterchangeabilityValidator('', '', use_cache=False)
+        for guard in ('__name__ == "__main__"', "'__main__' == __name__"):
+            with self.subTest(guard=guard):
+                path = self.write('guarded.py', source.format(guard=guard))
+                analysis = self.quietly(validator.analyze_file_structure, path)
+                self.assertEqual(analysis.function_names, frozenset({'f'}))
+                self.assertEqual(analysis.variable_names, frozenset({'imported', 'debug_level'}))
+
+
+class ValidateTest(ValidatorTestCase):
+    
+    def test_reused_validator_drops_previous_differential_results(self):
+        original = self.write('a.py', "def f(x):\n    return x\n")
+        changed = self.write('b.py', "def f(x):\n    return 1\n")
+        validator = miv.ModuleInterchangeabilityValidator(original, changed, run_differential=True)
+        self.quietly(validator.validate)
+        self.assertTrue(validator.differential_tester.test_results)
+        
+        # Byte-identical files skip the differential tests: nothing from the last run may remain
+        validator.test_file = self.write('a_copy.py', "def f(x):\n    return x\n")
+        self.assertTrue(self.quietly(validator.validate))
+        self.assertEqual(validator.differential_tester.test_results, [])
+        self.assertEqual(validator.calculate_compatibility_score(), 100.0)
+
+if __name__ == '__main__':
+    unittest.main()